@@ -15,6 +15,7 @@ INPUT_SPREADSHEET_GID=""
 
 PYTHON="python"
 HTML_EXPORT_DIR="$("$PYTHON" -m site --user-site)/data/htmlexport"
+ASSET_CACHE_DIR="$ROOT/.assets"
 
 # Clean up
 cleanup() {
@@ -99,6 +100,16 @@ create_input_csv() {
     fi
 }
 
+# Store media under content-hashed names (unchanged files are reused)
+build_assets() {
+    "$PYTHON" ../assets.py build media $ASSET_CACHE_DIR
+}
+
+# Point pages to the hashed (long-lived cacheable) media URLs
+fix_media_urls() {
+    find $1 -type f -name "*.html" -exec "$PYTHON" $ROOT/../assets.py rewrite $ASSET_CACHE_DIR/manifest.json /media/ {} +
+}
+
 # Generate HTML
 generate_html() {
     cp params_workshops.py ../params.py
@@ -112,7 +123,7 @@ merge_html() {
     mkdir $HTML_EXPORT_DIR/$EVENT-merged
     (cd $HTML_EXPORT_DIR/$EVENT && cp -r * ../$EVENT-merged)
     (cd $HTML_EXPORT_DIR/$EVENT-workshops && cp -r * ../$EVENT-merged)
-    cp $ROOT/media/* $HTML_EXPORT_DIR/$EVENT-merged/media
+    "$PYTHON" $ROOT/../assets.py export $ASSET_CACHE_DIR $HTML_EXPORT_DIR/$EVENT-merged/media
     cp $ROOT/static/* $HTML_EXPORT_DIR/$EVENT-merged/static
 }
 
@@ -138,9 +149,9 @@ fix_schedule_page() {
         other_prefix="asplos-eurosys-2025"
         other="Conference"
     fi
-    # Change Speakers to Conference/Workshops button and add Map button
+    # Change Speakers to Conference/Workshops button and add Map and Browse buttons
     sed -i "s/$prefix\/speaker/$other_prefix\/schedule/g" $2
-    sed -i "s/Speakers/$other<\/a><a href=\"\/media\/postillion-floorplan.pdf\" class=\"btn btn-outline-success\">Map/g" $2
+    sed -i "s/Speakers/$other<\/a><a href=\"\/media\/postillion-floorplan.pdf\" class=\"btn btn-outline-success\">Map<\/a><a href=\"\/static\/browse.html?event=$prefix\" class=\"btn btn-outline-success\">Browse/g" $2
 
     # Fix horizontal scroll on mobile and no-room sessions
     sed -i 's|</head>|<link rel="stylesheet" type="text/css" href="/static/extras.css" /><script src="/static/extras.js"></script></head>|' $2
@@ -156,6 +167,7 @@ echo "*** Building html files..."
 cleanup
 create_config_files
 create_input_csv
+build_assets
 generate_html
 
 echo "*** Merging html files..."
@@ -168,6 +180,7 @@ fix_schedule_page "Conference" $EVENT/schedule/index.html
 fix_schedule_page "Conference" $EVENT/talk/index.html
 fix_schedule_page "Workshops" $EVENT-workshops/schedule/index.html
 fix_schedule_page "Workshops" $EVENT-workshops/talk/index.html
+fix_media_urls .
 fix_primary_color .
 
 if type upload &>/dev/null; then
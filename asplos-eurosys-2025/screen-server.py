@@ -0,0 +1,381 @@
+import argparse
+import html
+import importlib.util
+import os
+import queue
+import sys
+import threading
+import time
+import pytz
+
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
+sys.path.insert(0, "..")
+
+from schedule import parse_csv, slugify
+
+# Track name -> color, from the TRACKS setting
+track_colors = {}
+
+# Seconds between CSV/clock checks (bounds the update latency)
+POLL_INTERVAL = 0.2
+# Seconds between SSE keepalive comments
+KEEPALIVE_INTERVAL = 15
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+  body {{ margin: 0; font-family: Arial, sans-serif; background: #ffffff; color: black; }}
+  h1 {{ margin: 0; padding: 0.3em 0.5em; background: #506784; color: white; font-size: 4vw; }}
+  section {{ margin: 1.5vw; padding: 1vw 1.5vw; border-left: 1vw solid; background: #C8D4E3; }}
+  h2 {{ margin: 0; font-size: 2vw; text-transform: uppercase; color: #506784; }}
+  .name {{ font-size: 3.5vw; font-weight: bold; }}
+  .time, .track, .empty {{ font-size: 2.2vw; }}
+  .progress {{ width: 100%; height: 0.6vw; display: block; margin-top: 0.5vw; }}
+  .progress rect {{ fill: #506784; }}
+  table {{ width: 100%; border-collapse: collapse; font-size: 1.8vw; }}
+  th {{ background: #506784; color: white; text-align: left; padding: 0.4em; }}
+  td {{ padding: 0.4em; font-weight: bold; vertical-align: top; }}
+  tr:nth-child(even) td {{ background: #C8D4E3; }}
+  a {{ color: inherit; }}
+</style>
+</head>
+<body>
+<div id="view">{body}</div>
+<script>
+const offset = {server_now} - Date.now();
+function updateProgress() {{
+  const now = Date.now() + offset;
+  document.querySelectorAll(".progress").forEach((svg) => {{
+    const start = Number(svg.dataset.start);
+    const end = Number(svg.dataset.end);
+    const done = Math.min(1, Math.max(0, (now - start) / (end - start)));
+    svg.querySelector("rect").setAttribute("width", (done * 100).toFixed(1));
+  }});
+}}
+if ({live}) {{
+  const source = new EventSource("/events{path}");
+  source.onmessage = (e) => {{
+    document.getElementById("view").innerHTML = e.data;
+    updateProgress();
+  }};
+}}
+updateProgress();
+setInterval(updateProgress, 10000);
+</script>
+</body>
+</html>
+"""
+
+
+def load_params(path):
+    """Loads the params file autoschedule.py uses (../params.py by default)."""
+    if not os.path.exists(path):
+        print("Please create params.py based on params_default.py first.")
+        sys.exit(1)
+    spec = importlib.util.spec_from_file_location("params", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # Screens only care about the current date, so keep every CSV column
+    # (e.g. workshop days when params.py holds the conference settings)
+    module.START_DATE = datetime(1900, 1, 1).strftime(module.DATE_FORMAT)
+    module.END_DATE = datetime(9999, 12, 31).strftime(module.DATE_FORMAT)
+    return module
+
+
+def get_session_color(track):
+    return track_colors.get(track, "black")
+
+
+def millis(dt):
+    return int(dt.timestamp() * 1000)
+
+
+def session_span(date, session, tz):
+    start = tz.localize(datetime.combine(date, session.start_time))
+    end = tz.localize(datetime.combine(date, session.end_time))
+    return start, end
+
+
+def now_next(date, sessions, now, tz):
+    """Returns the session running at 'now' and the one after it (or None)."""
+    current = None
+    for session in sessions:
+        start, end = session_span(date, session, tz)
+        if start <= now < end:
+            current = session
+        elif start >= now:
+            return current, session
+    return current, None
+
+
+def render_session(date, session, label, progress, tz):
+    if not session:
+        return (f'<section style="border-color: #C8D4E3"><h2>{label}</h2>'
+                f'<div class="empty">Nothing scheduled</div></section>')
+    color = get_session_color(session.track)
+    start, end = session_span(date, session, tz)
+    bar = ""
+    if progress:
+        bar = (f'<svg class="progress" viewBox="0 0 100 1" preserveAspectRatio="none" '
+               f'data-start="{millis(start)}" data-end="{millis(end)}">'
+               f'<rect height="1" width="0"/></svg>')
+    return (f'<section style="border-color: {color}"><h2>{label}</h2>'
+            f'<div class="time">{start:%H:%M} - {end:%H:%M}</div>'
+            f'<div class="name" style="color: {color}">{html.escape(session.name)}</div>'
+            f'<div class="track">{html.escape(session.track)}</div>{bar}</section>')
+
+
+def render_room(room, date, status, tz):
+    current, upcoming = status
+    return (f"<h1>{html.escape(room)}</h1>"
+            f"{render_session(date, current, 'Now', True, tz)}"
+            f"{render_session(date, upcoming, 'Next', False, tz)}")
+
+
+def render_lobby_row(room, status):
+    cells = []
+    for session in status:
+        if session:
+            cells.append(
+                f'<td style="color: {get_session_color(session.track)}">'
+                f'{session.start_time:%H:%M} {html.escape(session.name)}</td>')
+        else:
+            cells.append("<td></td>")
+    return (f'<tr><td><a href="/room/{slugify(room)}">{html.escape(room)}</a></td>'
+            f'{"".join(cells)}</tr>')
+
+
+def render_lobby(date, rows):
+    return (f"<h1>{date:%A %d %B}</h1>"
+            f"<table><tr><th>Room</th><th>Now</th><th>Next</th></tr>"
+            f"{''.join(rows.values())}</table>")
+
+
+def session_key(session):
+    if not session:
+        return None
+    return (session.name, session.track, session.description,
+            session.start_time, session.end_time)
+
+
+class ScreenState:
+    """
+    Keeps the rendered per-room and lobby views up to date and pushes them
+    to connected screens. Only rooms whose sessions or now/next status
+    changed are re-rendered.
+    """
+
+    def __init__(self, params, csv_path, tz, date, clock):
+        self.params = params
+        self.csv_path = csv_path
+        self.tz = tz
+        self.date = date
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.stat = None
+        self.rooms = {}        # room (every room in the CSV) -> sessions on self.date
+        self.keys = {}         # room -> session keys, to detect changes
+        self.status = {}       # room -> (now, next)
+        self.lobby_rows = {}   # room -> rendered lobby row
+        self.views = {}        # view path -> rendered HTML
+        self.clients = {}      # view path -> set of client queues
+
+    def view_path(self, room):
+        return f"/room/{slugify(room)}"
+
+    def subscribe(self, path):
+        q = queue.Queue()
+        with self.lock:
+            self.clients.setdefault(path, set()).add(q)
+            if path in self.views:
+                q.put(self.views[path])
+        return q
+
+    def unsubscribe(self, path, q):
+        with self.lock:
+            self.clients.get(path, set()).discard(q)
+
+    def publish(self, path, body):
+        self.views[path] = body
+        for q in self.clients.get(path, ()):
+            q.put(body)
+
+    def load(self):
+        """Re-parses the CSV if it changed on disk; returns the changed rooms."""
+        try:
+            st = os.stat(self.csv_path)
+        except FileNotFoundError:
+            return set()
+        stat = (st.st_mtime_ns, st.st_size)
+        if stat == self.stat:
+            return set()
+        self.stat = stat
+
+        try:
+            days = parse_csv(self.csv_path, self.params)
+        except Exception as e:
+            print(f"*Error parsing {self.csv_path}: {e}")
+            return set()
+
+        # Register rooms used on other dates too, so their screens stay live
+        rooms = {}
+        for day in days:
+            sessions = rooms.setdefault(day.room, [])
+            if day.date == self.date:
+                sessions.extend(day.sessions)
+        for sessions in rooms.values():
+            sessions.sort(key=lambda s: s.start_time)
+
+        changed = set(self.rooms) - set(rooms)
+        for room, sessions in rooms.items():
+            keys = [session_key(s) for s in sessions]
+            if self.keys.get(room) != keys:
+                self.keys[room] = keys
+                changed.add(room)
+        for room in set(self.rooms) - set(rooms):
+            self.keys.pop(room, None)
+        self.rooms = rooms
+        return changed
+
+    def refresh(self):
+        with self.lock:
+            now = self.clock()
+            if now.date() != self.date:
+                # New day: reload the CSV and re-render everything
+                self.date = now.date()
+                self.stat = None
+                self.keys = {}
+            changed = self.load()
+            for room, sessions in self.rooms.items():
+                status = now_next(self.date, sessions, now, self.tz)
+                old = self.status.get(room, (None, None))
+                if room in changed or list(map(session_key, old)) != list(map(session_key, status)):
+                    self.status[room] = status
+                    changed.add(room)
+
+            if not changed:
+                return
+            for room in changed:
+                path = self.view_path(room)
+                if room in self.rooms:
+                    status = self.status[room]
+                    self.publish(path, render_room(room, self.date, status, self.tz))
+                    self.lobby_rows[room] = render_lobby_row(room, status)
+                else:
+                    self.status.pop(room, None)
+                    self.lobby_rows.pop(room, None)
+                    self.publish(path, render_room(room, self.date, (None, None), self.tz))
+            # Keep the CSV room order in the lobby
+            self.lobby_rows = {room: self.lobby_rows[room] for room in self.rooms}
+            self.publish("/lobby", render_lobby(self.date, self.lobby_rows))
+            print(f"*Updated {', '.join(sorted(changed))} at {now:%H:%M:%S}")
+
+    def watch(self):
+        while True:
+            self.refresh()
+            time.sleep(POLL_INTERVAL)
+
+
+class ScreenHandler(BaseHTTPRequestHandler):
+    state = None
+
+    def send_body(self, body, content_type="text/html; charset=utf-8", status=200):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_page(self, title, body, path="", live=True):
+        self.send_body(PAGE.format(
+            title=html.escape(title), body=body, path=path,
+            live="true" if live else "false",
+            server_now=millis(self.state.clock())))
+
+    def do_GET(self):
+        path = self.path.split("?")[0].rstrip("/") or "/"
+        if path.startswith("/events/"):
+            self.stream(path[len("/events"):])
+        elif path == "/":
+            links = "".join(
+                f'<tr><td><a href="{self.state.view_path(room)}">{html.escape(room)}</a></td></tr>'
+                for room in self.state.rooms)
+            self.send_page("Screens", f'<h1><a href="/lobby">Lobby</a></h1><table>{links}</table>',
+                           live=False)
+        elif path == "/lobby" or path.startswith("/room/"):
+            # Rooms not in the CSV (yet) still get a live page for later pushes
+            state = self.state
+            body = state.views.get(path) or render_room(
+                path.rsplit("/", 1)[-1], state.date, (None, None), state.tz)
+            self.send_page(path, body, path)
+        else:
+            self.send_body("Not found", "text/plain", 404)
+
+    def stream(self, path):
+        """Server-sent events: pushes the view whenever it is re-rendered."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        q = self.state.subscribe(path)
+        try:
+            while True:
+                try:
+                    body = q.get(timeout=KEEPALIVE_INTERVAL)
+                    data = "".join(f"data: {line}\n" for line in body.split("\n"))
+                    self.wfile.write(f"{data}\n".encode("utf-8"))
+                except queue.Empty:
+                    self.wfile.write(b": keepalive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.state.unsubscribe(path, q)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve live now/next views for the conference screens.")
+    parser.add_argument("--params", default="../params.py",
+                        help="params file (default: ../params.py)")
+    parser.add_argument("--csv", help="schedule CSV (default: CSV_FILE from params)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--now", help="simulated start time, e.g. '2025-04-01 10:15'")
+    args = parser.parse_args()
+
+    p = load_params(args.params)
+    tz = pytz.timezone(p.TIMEZONE)
+    track_colors.update({t["name"]: t["color"] for t in p.TRACKS})
+
+    offset = timedelta()
+    if args.now:
+        offset = tz.localize(datetime.strptime(
+            args.now, "%Y-%m-%d %H:%M")) - datetime.now(tz)
+
+    def clock():
+        return tz.normalize(datetime.now(tz) + offset)
+
+    state = ScreenState(p, args.csv or p.CSV_FILE, tz, clock().date(), clock)
+    state.refresh()
+    threading.Thread(target=state.watch, daemon=True).start()
+
+    ScreenHandler.state = state
+    server = ThreadingHTTPServer((args.host, args.port), ScreenHandler)
+    server.daemon_threads = True
+    print(f"*Serving screens at http://{args.host}:{args.port}/ (lobby: /lobby)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
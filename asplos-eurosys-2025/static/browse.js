@@ -0,0 +1,120 @@
+// Loads only the schedule index shard matching the selected filters.
+// URL: /static/browse.html?event=<slug>[&day=<date>][&room=<room>][&track=<track>]
+const INDEX_DIR = "schedule/index";
+
+const params = new URLSearchParams(window.location.search);
+const eventSlug = params.get("event") || "asplos-eurosys-2025";
+const indexUrl = `/${eventSlug}/${INDEX_DIR}/`;
+
+function pickShard(manifest, filters) {
+  // Prefer the smallest shard covering the filters, filter the rest locally
+  if (filters.day && filters.room) {
+    return manifest["day-room"][`${filters.day}/${filters.room}`];
+  }
+  if (filters.room) return manifest.room[filters.room];
+  if (filters.track) return manifest.track[filters.track];
+  if (filters.day) return manifest.day[filters.day];
+  return null;
+}
+
+function matches(session, filters) {
+  return ["day", "room", "track"].every((key) => {
+    const value = key === "day" ? session.date : session[key];
+    return !filters[key] || value === filters[key];
+  });
+}
+
+function renderError(message) {
+  document.getElementById("sessions").textContent = message;
+}
+
+async function fetchJson(url, options) {
+  const response = await fetch(url, options);
+  if (!response.ok) throw new Error(`${url}: ${response.status}`);
+  return response.json();
+}
+
+function renderSessions(sessions) {
+  const list = document.getElementById("sessions");
+  list.replaceChildren();
+  if (!sessions.length) {
+    list.textContent = "No sessions.";
+    return;
+  }
+  sessions.forEach((session) => {
+    const item = document.createElement("li");
+    const title = document.createElement("div");
+    const time = document.createElement("b");
+    time.textContent = `${session.start}-${session.end} `;
+    if (session.code) {
+      // Details (description, etc.) live on the pretalx talk page
+      const link = document.createElement("a");
+      link.href = `/${eventSlug}/talk/${session.code}/`;
+      link.textContent = session.name;
+      title.append(time, link);
+    } else {
+      title.append(time, session.name);
+    }
+    const meta = document.createElement("div");
+    meta.className = "meta";
+    meta.textContent = `${session.date} | ${session.room} | ${session.track}`;
+    item.append(title, meta);
+    list.append(item);
+  });
+}
+
+function fillSelect(select, keys, current) {
+  keys.forEach((key) => {
+    const option = new Option(key, key, false, key === current);
+    select.append(option);
+  });
+}
+
+async function loadSlice(manifest, filters) {
+  const shard = pickShard(manifest, filters);
+  if (!shard) {
+    renderSessions([]);
+    return;
+  }
+  try {
+    const sessions = await fetchJson(indexUrl + shard);
+    renderSessions(sessions.filter((session) => matches(session, filters)));
+  } catch (e) {
+    renderError(`Could not load the schedule (${e.message}).`);
+  }
+}
+
+async function initBrowse() {
+  let manifest;
+  try {
+    manifest = await fetchJson(indexUrl + "manifest.json", { cache: "no-cache" });
+  } catch (e) {
+    renderError(`Could not load the schedule (${e.message}).`);
+    return;
+  }
+  const form = document.getElementById("filters");
+  const filters = {};
+  ["day", "room", "track"].forEach((key) => {
+    filters[key] = params.get(key) || "";
+    fillSelect(form.elements[key], Object.keys(manifest[key]), filters[key]);
+  });
+  if (!filters.day && !filters.room && !filters.track) {
+    // Default to today (or the first day) rather than the whole program
+    const today = new Date().toLocaleDateString("sv"); // local YYYY-MM-DD
+    const days = Object.keys(manifest.day);
+    filters.day = days.includes(today) ? today : days[0] || "";
+    form.elements.day.value = filters.day;
+  }
+  form.addEventListener("change", () => {
+    ["day", "room", "track"].forEach((key) => {
+      filters[key] = form.elements[key].value;
+      if (filters[key]) params.set(key, filters[key]); else params.delete(key);
+    });
+    params.set("event", eventSlug);
+    history.replaceState(null, "", `?${params}`);
+    loadSlice(manifest, filters);
+  });
+  loadSlice(manifest, filters);
+}
+
+window.addEventListener("DOMContentLoaded", initBrowse);
@@ -0,0 +1,191 @@
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import sys
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Hex digits of the content hash kept in asset file names
+HASH_LENGTH = 12
+
+# Widths of the downscaled image variants (header, screens, mobile)
+IMAGE_WIDTHS = [480, 960, 1280, 1920]
+IMAGE_EXTENSIONS = [".png", ".jpg", ".jpeg", ".webp"]
+
+# Displayed width of the images picking a variant from the srcset (the
+# pretalx header logo is at most ~540px wide)
+IMAGE_SIZES = "(max-width: 540px) 100vw, 540px"
+
+MANIFEST_NAME = "manifest.json"
+
+
+def file_digest(path):
+    """Returns the truncated SHA-256 digest of the file contents."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 16), b""):
+            sha.update(chunk)
+    return sha.hexdigest()[:HASH_LENGTH]
+
+
+def hashed_name(path, digest, width=None):
+    """
+    Builds a content-addressed file name, e.g. logo.<digest>.png or
+    logo.<digest>.960w.png for a variant.
+    """
+    stem, ext = os.path.splitext(os.path.basename(path))
+    if width:
+        return f"{stem}.{digest}.{width}w{ext}"
+    return f"{stem}.{digest}{ext}"
+
+
+def variant_widths(path):
+    """Returns the variant widths smaller than the image (none for non-images)."""
+    if os.path.splitext(path)[1].lower() not in IMAGE_EXTENSIONS:
+        return []
+    if Image is None:
+        print(f"Warning: Pillow not installed, no size variants for {path}")
+        return []
+    with Image.open(path) as image:
+        return [w for w in IMAGE_WIDTHS if w < image.width]
+
+
+def render_variant(path, width):
+    """Returns the image downscaled to the given width as optimized bytes."""
+    with Image.open(path) as image:
+        height = round(image.height * width / image.width)
+        resized = image.resize((width, height), Image.LANCZOS)
+        out = io.BytesIO()
+        resized.save(out, format=image.format, optimize=True)
+        return out.getvalue()
+
+
+def publish(path, exists, save, variants=True):
+    """
+    Stores a file (and, optionally, its image variants) under hash-based
+    names through the given exists(name) and save(name, data) callbacks.
+    Files already present are reused. Returns the manifest entry.
+    """
+    digest = file_digest(path)
+    entry = {"file": hashed_name(path, digest), "variants": {}}
+
+    if not exists(entry["file"]):
+        print(f"Storing asset: {entry['file']}")
+        with open(path, "rb") as file:
+            save(entry["file"], file.read())
+
+    if not variants:
+        return entry
+    for width in variant_widths(path):
+        name = hashed_name(path, digest, width)
+        entry["variants"][str(width)] = name
+        if not exists(name):
+            print(f"Storing asset variant: {name}")
+            save(name, render_variant(path, width))
+
+    return entry
+
+
+def manifest_files(manifest):
+    """Returns the names of all files (originals and variants) in the manifest."""
+    for entry in manifest.values():
+        yield entry["file"]
+        yield from entry["variants"].values()
+
+
+def build(src_dir, dest_dir):
+    """Publishes all files in src_dir and writes the manifest to dest_dir."""
+    os.makedirs(dest_dir, exist_ok=True)
+
+    def exists(name):
+        return os.path.exists(os.path.join(dest_dir, name))
+
+    def save(name, data):
+        # Write then rename, so an interrupted run never leaves a truncated
+        # file under a (reused, long-cached) hashed name
+        target = os.path.join(dest_dir, name)
+        with open(f"{target}.tmp", "wb") as file:
+            file.write(data)
+        os.replace(f"{target}.tmp", target)
+
+    manifest = {}
+    for name in sorted(os.listdir(src_dir)):
+        path = os.path.join(src_dir, name)
+        if os.path.isfile(path):
+            manifest[name] = publish(path, exists, save)
+
+    with open(os.path.join(dest_dir, MANIFEST_NAME), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    return manifest
+
+
+def export(assets_dir, dest_dir):
+    """
+    Copies only the files listed in the current manifest to dest_dir. Each
+    original is also copied under its unhashed name, so existing links
+    (e.g. printed QR codes to the floor plan) keep working.
+    """
+    with open(os.path.join(assets_dir, MANIFEST_NAME), "r", encoding="utf-8") as file:
+        manifest = json.load(file)
+    os.makedirs(dest_dir, exist_ok=True)
+    for name in manifest_files(manifest):
+        shutil.copyfile(os.path.join(assets_dir, name), os.path.join(dest_dir, name))
+    for name, entry in manifest.items():
+        shutil.copyfile(os.path.join(assets_dir, entry["file"]), os.path.join(dest_dir, name))
+
+
+def srcset(entry, url_prefix):
+    widths = sorted(entry["variants"], key=int)
+    return ", ".join(f"{url_prefix}{entry['variants'][w]} {w}w" for w in widths)
+
+
+def rewrite(manifest, url_prefix, paths, sizes=IMAGE_SIZES):
+    """
+    Replaces references to the original asset URLs in the given pages with
+    their hashed URLs. Image tags showing an asset, including the copy pretalx
+    serves from its own media storage (event logo/header), also get a srcset
+    of the variants published under url_prefix and the given sizes.
+    """
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as file:
+            html = file.read()
+
+        for name, entry in manifest.items():
+            url = f"{url_prefix}{name}"
+            html = html.replace(url, f"{url_prefix}{entry['file']}")
+            if entry["variants"]:
+                pattern = rf'src="[^"]*/{re.escape(entry["file"])}"(?! srcset=)'
+                html = re.sub(
+                    pattern,
+                    lambda m: (f'{m.group(0)} srcset="{srcset(entry, url_prefix)}" '
+                               f'sizes="{sizes}"'),
+                    html)
+
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(html)
+
+
+def main():
+    if len(sys.argv) >= 4 and sys.argv[1] == "build":
+        build(sys.argv[2], sys.argv[3])
+    elif len(sys.argv) >= 4 and sys.argv[1] == "export":
+        export(sys.argv[2], sys.argv[3])
+    elif len(sys.argv) >= 4 and sys.argv[1] == "rewrite":
+        with open(sys.argv[2], "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+        rewrite(manifest, sys.argv[3], sys.argv[4:])
+    else:
+        print("Usage: assets.py build <src_dir> <assets_dir>")
+        print("       assets.py export <assets_dir> <dest_dir>")
+        print("       assets.py rewrite <manifest> <url_prefix> <page>...")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,15 @@
-import csv
+import hashlib
+import json
+import shutil
 import sys
-import re
 import django
 import os
 import pytz
 
 from django_scopes import scope, scopes_disabled
-from django.core.files import File
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.core.management import call_command
 
 # Set up Django environment (adjust path as needed)
@@ -20,6 +23,9 @@ from pretalx.person.models import User
 from pretalx.event.models import Event, Organiser, Team
 from datetime import datetime, timedelta
 
+import assets
+from schedule import parse_csv, session_record, slugify
+
 try:
     import params as p
 except ImportError:
@@ -27,125 +33,47 @@ except ImportError:
     sys.exit(1)
 
 
-class Session:
-    def __init__(self, name, track, description, start_time, end_time, abstract):
-        self.name = name
-        self.track = track
-        self.start_time = start_time
-        self.end_time = end_time
-        self.abstract = abstract
-
-        self.description = description
-
-    def __str__(self):
-        return (
-            f"Session: {self.name} | Track: {self.track} | {self.start_time}-{self.end_time}\n"
-            f"Description: {self.description}\n"
-            f"Abstract: {self.abstract}"
-        )
-
-
-class Day:
-    def __init__(self, date, room):
-        self.date = date
-        self.room = room
-        self.sessions = []
-
-    def add_session(self, session):
-        self.sessions.append(session)
-
-    def __str__(self):
-        session_details = "\n".join(str(session) for session in self.sessions)
-        return f"Date: {self.date} | Room: {self.room}\n{session_details}"
-
+def write_shard(index_dir, kind, key, records):
+    """Writes a shard under a content-hashed name and returns its path."""
+    data = json.dumps(records, ensure_ascii=False, separators=(",", ":"))
+    digest = hashlib.sha256(data.encode("utf-8")).hexdigest()
+    name = f"{kind}/{key}.{digest[:assets.HASH_LENGTH]}.json"
+    os.makedirs(os.path.join(index_dir, kind), exist_ok=True)
+    with open(os.path.join(index_dir, name), "w", encoding="utf-8") as file:
+        file.write(data)
+    return name
 
-def parse_session_data(session_text, room):
-    """Extracts session name, track, and description from the given text."""
 
-    # Extract name
-    name_match = re.search(p.SESSION_NAME_REGEX, session_text)
-    name = name_match.group(1).strip() if name_match else None
-    if not name:
-        return None
-
-    # Extract track
-    track_match = re.search(p.SESSION_TRACK_REGEX, session_text)
-    track = track_match.group(1).strip(
-    ) if track_match else None
-    if not track:
-        return None
-
-    # Extract description
-    desc_match = re.search(p.SESSION_DESC_REGEX, session_text, re.DOTALL)
-    description = desc_match.group(1).strip() if desc_match else ""
-
-    return name, track, description
-
-
-def parse_time(time_string):
+def export_schedule_index(days, index_dir):
     """
-    Parses the start and end times from a string.
+    Exports the parsed schedule as compact JSON shards keyed by day, room,
+    track and day+room, plus a small manifest mapping keys to shards.
     """
-    start_time_str, end_time_str = time_string.split("-")
-    start_time = datetime.strptime(
-        start_time_str.strip(), p.TIME_FORMAT.split("-")[0]).time()
-    end_time = datetime.strptime(
-        end_time_str.strip(), p.TIME_FORMAT.split("-")[1]).time()
-    return start_time, end_time
-
-
-def parse_csv(file_path):
-    with open(file_path, "r", encoding="utf-8") as file:
-        reader = csv.reader(file, delimiter=p.CSV_DELIMITER)
-        data = list(reader)
-
-    days = []
-
-    # Identify day columns and their time columns
-    date_row = data[p.DATE_ROW_INDEX]
-    room_row = data[p.ROOM_ROW_INDEX]
-
-    start_date = datetime.strptime(p.START_DATE, p.DATE_FORMAT).date()
-    end_date = datetime.strptime(p.END_DATE, p.DATE_FORMAT).date()
-
-    day_columns = {}
-    time_column = None
-
-    for col_idx, cell in enumerate(date_row):
-        if room_row[col_idx] == "Time":
-            time_column = col_idx
-            continue
-        date = datetime.strptime(cell, p.DATE_FORMAT).date()
-        if date < start_date or date > end_date:
-            continue
-        day_columns[col_idx] = (time_column, date)
-
-    # Parse the data
-    for col_idx, t in day_columns.items():
-        time_column, date = t
-        room = room_row[col_idx]
-        day = Day(date, room)
-
-        for row_idx in range(p.SESSION_START_ROW_INDEX, len(data)):
-            row = data[row_idx]
-
-            if col_idx >= len(row) or not row[col_idx]:
-                continue
-
-            session_text = row[col_idx]
-            ret = parse_session_data(session_text, room)
-            if not ret:
-                continue
-            name, track, description = ret
-            start_time, end_time = parse_time(row[time_column])
-
-            session = Session(name, track, description,
-                              start_time, end_time, p.SESSION_ABSTRACT)
-            day.add_session(session)
-
-        days.append(day)
-
-    return days
+    shards = {"day": {}, "room": {}, "track": {}, "day-room": {}}
+    for kind in shards:
+        # Drop the hashed shards of previous runs
+        shutil.rmtree(os.path.join(index_dir, kind), ignore_errors=True)
+    os.makedirs(index_dir, exist_ok=True)
+    for day in days:
+        date = day.date.isoformat()
+        for session in sorted(day.sessions, key=lambda s: s.start_time):
+            record = session_record(day, session)
+            shards["day"].setdefault(date, []).append(record)
+            shards["room"].setdefault(day.room, []).append(record)
+            shards["track"].setdefault(session.track, []).append(record)
+            shards["day-room"].setdefault(
+                f"{date}/{day.room}", []).append(record)
+
+    manifest = {kind: {} for kind in shards}
+    for kind, groups in shards.items():
+        for key, records in groups.items():
+            records.sort(key=lambda r: (r["date"], r["start"], r["room"]))
+            manifest[kind][key] = write_shard(
+                index_dir, kind, slugify(key), records)
+
+    with open(os.path.join(index_dir, "manifest.json"), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, separators=(",", ":"))
+    print(f"Schedule index exported to {index_dir}")
 
 
 def object_lookup(objects, name):
@@ -188,6 +116,7 @@ def create_session(event, day, session):
         state="confirmed",  # Possible states: submitted, accepted, confirmed, rejected
     )
     submission.save()
+    session.code = submission.code
 
     # Define schedule slot (Start and End times)
     tz = pytz.timezone(p.TIMEZONE)
@@ -241,6 +170,23 @@ def delete_existing_data():
         return
 
 
+def store_image(path):
+    """
+    Stores an image in the media storage under a content-hashed name,
+    reusing the file stored by previous runs. Returns the storage name.
+    Its size variants are published with the other media by assets.py
+    and referenced from the exported pages.
+    """
+    base = f"{p.EVENT_SLUG}/{p.ASSETS_DIR}"
+    entry = assets.publish(
+        path,
+        lambda name: default_storage.exists(f"{base}/{name}"),
+        lambda name, data: default_storage.save(
+            f"{base}/{name}", ContentFile(data)),
+        variants=False)
+    return f"{base}/{entry['file']}"
+
+
 def create_event():
     if not p.ACTION_DELETE_ALL:
         event = Event.objects.filter(slug=p.EVENT_SLUG).first()
@@ -298,12 +244,9 @@ def create_event():
     if p.EVENT_PRIMARY_COLOR:
         event.primary_color = p.EVENT_PRIMARY_COLOR
     if p.EVENT_HEADER_IMAGE:
-        with open(p.EVENT_HEADER_IMAGE, "rb") as image_file:
-            event.header_image.save(os.path.basename(
-                p.EVENT_HEADER_IMAGE), File(image_file))
+        event.header_image.name = store_image(p.EVENT_HEADER_IMAGE)
     if p.EVENT_LOGO:
-        with open(p.EVENT_LOGO, "rb") as image_file:
-            event.logo.save(os.path.basename(p.EVENT_LOGO), File(image_file))
+        event.logo.name = store_image(p.EVENT_LOGO)
     event.save()
 
     return event
@@ -332,7 +275,7 @@ def main():
     create_tracks_rooms(event)
 
     print("Parsing CSV file...")
-    days = parse_csv(p.CSV_FILE)
+    days = parse_csv(p.CSV_FILE, p)
 
     create_schedule(event, days)
 
@@ -352,6 +295,13 @@ def main():
             print("HTML export completed successfully.")
         except Exception as e:
             print(f"Error triggering HTML export: {e}")
+            return
+
+        if p.ACTION_EXPORT_INDEX:
+            # pretalx exports the event pages to <root>/<slug>/<slug>/
+            index_dir = os.path.join(
+                settings.HTMLEXPORT_ROOT, p.EVENT_SLUG, p.EVENT_SLUG, p.INDEX_DIR)
+            export_schedule_index(days, index_dir)
 
 
 if __name__ == "__main__":
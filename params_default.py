@@ -43,6 +43,9 @@ EVENT_PRIMARY_COLOR = None
 EVENT_HEADER_IMAGE = None
 EVENT_LOGO = None
 
+# Media storage directory (per event) for content-hashed images
+ASSETS_DIR = "assets"
+
 ##################################################
 # User Settings
 ##################################################
@@ -59,6 +62,11 @@ ACTION_DELETE_ALL_ONLY = False
 ACTION_DELETE_ALL = True
 ACTION_EXPORT_HTML = True
 ACTION_REBUILD = True
+ACTION_EXPORT_INDEX = True
+
+# Schedule index (JSON shards) directory, relative to the event pages
+# (<slug>/<slug>/ in the HTML export)
+INDEX_DIR = "schedule/index"
 
 # Event
 EVENT_SLUG = "default"
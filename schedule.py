@@ -0,0 +1,146 @@
+import csv
+import re
+
+from datetime import datetime
+
+
+class Session:
+    def __init__(self, name, track, description, start_time, end_time, abstract):
+        self.name = name
+        self.track = track
+        self.start_time = start_time
+        self.end_time = end_time
+        self.abstract = abstract
+
+        self.description = description
+
+        # pretalx submission code, set once the session is created
+        self.code = None
+
+    def __str__(self):
+        return (
+            f"Session: {self.name} | Track: {self.track} | {self.start_time}-{self.end_time}\n"
+            f"Description: {self.description}\n"
+            f"Abstract: {self.abstract}"
+        )
+
+
+class Day:
+    def __init__(self, date, room):
+        self.date = date
+        self.room = room
+        self.sessions = []
+
+    def add_session(self, session):
+        self.sessions.append(session)
+
+    def __str__(self):
+        session_details = "\n".join(str(session) for session in self.sessions)
+        return f"Date: {self.date} | Room: {self.room}\n{session_details}"
+
+
+def parse_session_data(session_text, room, p):
+    """Extracts session name, track, and description from the given text."""
+
+    # Extract name
+    name_match = re.search(p.SESSION_NAME_REGEX, session_text)
+    name = name_match.group(1).strip() if name_match else None
+    if not name:
+        return None
+
+    # Extract track
+    track_match = re.search(p.SESSION_TRACK_REGEX, session_text)
+    track = track_match.group(1).strip(
+    ) if track_match else None
+    if not track:
+        return None
+
+    # Extract description
+    desc_match = re.search(p.SESSION_DESC_REGEX, session_text, re.DOTALL)
+    description = desc_match.group(1).strip() if desc_match else ""
+
+    return name, track, description
+
+
+def parse_time(time_string, p):
+    """
+    Parses the start and end times from a string.
+    """
+    start_time_str, end_time_str = time_string.split("-")
+    start_time = datetime.strptime(
+        start_time_str.strip(), p.TIME_FORMAT.split("-")[0]).time()
+    end_time = datetime.strptime(
+        end_time_str.strip(), p.TIME_FORMAT.split("-")[1]).time()
+    return start_time, end_time
+
+
+def parse_csv(file_path, p):
+    with open(file_path, "r", encoding="utf-8") as file:
+        reader = csv.reader(file, delimiter=p.CSV_DELIMITER)
+        data = list(reader)
+
+    days = []
+
+    # Identify day columns and their time columns
+    date_row = data[p.DATE_ROW_INDEX]
+    room_row = data[p.ROOM_ROW_INDEX]
+
+    start_date = datetime.strptime(p.START_DATE, p.DATE_FORMAT).date()
+    end_date = datetime.strptime(p.END_DATE, p.DATE_FORMAT).date()
+
+    day_columns = {}
+    time_column = None
+
+    for col_idx, cell in enumerate(date_row):
+        if room_row[col_idx] == "Time":
+            time_column = col_idx
+            continue
+        date = datetime.strptime(cell, p.DATE_FORMAT).date()
+        if date < start_date or date > end_date:
+            continue
+        day_columns[col_idx] = (time_column, date)
+
+    # Parse the data
+    for col_idx, t in day_columns.items():
+        time_column, date = t
+        room = room_row[col_idx]
+        day = Day(date, room)
+
+        for row_idx in range(p.SESSION_START_ROW_INDEX, len(data)):
+            row = data[row_idx]
+
+            if col_idx >= len(row) or not row[col_idx]:
+                continue
+
+            session_text = row[col_idx]
+            ret = parse_session_data(session_text, room, p)
+            if not ret:
+                continue
+            name, track, description = ret
+            start_time, end_time = parse_time(row[time_column], p)
+
+            session = Session(name, track, description,
+                              start_time, end_time, p.SESSION_ABSTRACT)
+            day.add_session(session)
+
+        days.append(day)
+
+    return days
+
+
+def slugify(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def session_record(day, session):
+    record = {
+        "date": day.date.isoformat(),
+        "room": day.room,
+        "start": session.start_time.strftime("%H:%M"),
+        "end": session.end_time.strftime("%H:%M"),
+        "name": session.name,
+        "track": session.track,
+    }
+    if session.code:
+        record["code"] = session.code
+    return record